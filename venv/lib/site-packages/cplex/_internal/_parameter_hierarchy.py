@@ -0,0 +1,320 @@
+# --------------------------------------------------------------------------
+# Version 20.1.0
+# --------------------------------------------------------------------------
+# Licensed Materials - Property of IBM
+# 5725-A06 5725-A29 5724-Y48 5724-Y49 5724-Y54 5724-Y55 5655-Y21
+# Copyright IBM Corporation 2000, 2020. All Rights Reserved.
+#
+# US Government Users Restricted Rights - Use, duplication or
+# disclosure restricted by GSA ADP Schedule Contract with
+# IBM Corp.
+# --------------------------------------------------------------------------
+# pylint: disable=line-too-long
+"""Parameter hierarchy for the CPLEX Python API.
+
+"""
+from sys import intern as _intern
+
+from . import _parameters_auto as _auto
+from . import _parameter_classes as _cls
+
+# Local aliases for the wrapper classes: the spec rows below reference
+# these hundreds of times, and a bare name resolves in one load.
+_NP = _cls.NumParameter
+_SP = _cls.StrParameter
+_PG = _cls.ParameterGroup
+
+
+class _MembersSpec():
+    """non-public: a declarative description of one parameter group.
+
+    fill() builds the group members from the (pyname, cls, about,
+    constants) rows, writing them straight into the group's own
+    __dict__; about is a _parameters_auto entry for parameters and a
+    nested _MembersSpec for sub-groups. Building in place avoids
+    allocating (and copying from) an intermediate members dict per
+    group. The _auto/_cls attribute lookups are resolved once at import
+    time, when the specs are built.
+    """
+
+    __slots__ = ('name', 'help', 'rows')
+
+    def __init__(self, name, help_, rows):
+        # Interning the member names means every dict key and Parameter
+        # name in the hierarchy shares one backing str object, so later
+        # attribute lookups compare by pointer.
+        self.name = _intern(name)
+        self.help = help_
+        self.rows = tuple((_intern(pyname), cls, about, constants)
+                          for pyname, cls, about, constants in rows)
+
+    def fill(self, env, group):
+        groupdict = group.__dict__
+        for pyname, cls, about, constants in self.rows:
+            groupdict[pyname] = (
+                cls(env, about, group) if cls is _PG else
+                cls(env, about, group, pyname) if constants is None
+                else cls(env, about, group, pyname, constants))
+
+
+_SPEC = \
+    ("parameters", "CPLEX parameter hierarchy.", (
+        ('advance', _NP, _auto.setAdvance, _cls.advance_constants),
+        ('barrier', _PG, ("barrier", "Parameters for barrier optimization.", (
+            ('algorithm', _NP, _auto.BarrierAlgorithm, _cls.bar_alg_constants),
+            ('colnonzeros', _NP, _auto.BarrierColNonzeros, None),
+            ('convergetol', _NP, _auto.BarrierConvergeTol, None),
+            ('crossover', _NP, _auto.BarrierCrossover, _cls.crossover_constants),
+            ('display', _NP, _auto.BarrierDisplay, _cls.display_constants),
+            ('limits', _PG, ("limits", "Limits for barrier optimization.", (
+                ('corrections', _NP, _auto.BarrierLimitsCorrections, None),
+                ('growth', _NP, _auto.BarrierLimitsGrowth, None),
+                ('iteration', _NP, _auto.BarrierLimitsIteration, None),
+                ('objrange', _NP, _auto.BarrierLimitsObjRange, None),
+            )), None),
+            ('ordering', _NP, _auto.BarrierOrdering, _cls.bar_order_constants),
+            ('qcpconvergetol', _NP, _auto.BarrierQCPConvergeTol, None),
+            ('startalg', _NP, _auto.BarrierStartAlg, _cls.bar_start_alg_constants),
+        )), None),
+        ('benders', _PG, ("benders", "Parameters for benders optimization.", (
+            ('strategy', _NP, _auto.BendersStrategy, _cls.benders_strategy_constants),
+            ('tolerances', _PG, ("tolerances", "Numerical tolerances for Benders cuts.", (
+                ('feasibilitycut', _NP, _auto.BendersTolerancesFeasibilityCut, None),
+                ('optimalitycut', _NP, _auto.BendersTolerancesOptimalityCut, None),
+            )), None),
+            ('workeralgorithm', _NP, _auto.BendersWorkerAlgorithm, _cls.subalg_constants),
+        )), None),
+        ('clocktype', _NP, _auto.setClockType, _cls.clocktype_constants),
+        ('conflict', _PG, ("conflict", "Parameters for finding conflicts.", (
+            ('algorithm', _NP, _auto.ConflictAlgorithm, _cls.conflict_algorithm_constants),
+            ('display', _NP, _auto.ConflictDisplay, _cls.display_constants),
+        )), None),
+        ('cpumask', _SP, _auto.setCPUmask, None),
+        ('dettimelimit', _NP, _auto.setDetTimeLimit, None),
+        ('distmip', _PG, ("distmip", "Distributed parallel mixed integer optimization.", (
+            ('rampup', _PG, ("rampup", "Rampup related parameters in distributed MIP.", (
+                ('dettimelimit', _NP, _auto.DistMIPRampupDetTimeLimit, None),
+                ('duration', _NP, _auto.DistMIPRampupDuration, _cls.rampup_duration_constants),
+                ('timelimit', _NP, _auto.DistMIPRampupTimeLimit, None),
+            )), None),
+        )), None),
+        ('emphasis', _PG, ("emphasis", "Optimization emphasis.", (
+            ('memory', _NP, _auto.EmphasisMemory, _cls.off_on_constants),
+            ('mip', _NP, _auto.EmphasisMIP, _cls.mip_emph_constants),
+            ('numerical', _NP, _auto.EmphasisNumerical, _cls.off_on_constants),
+        )), None),
+        ('feasopt', _PG, ("feasopt", "Parameters for feasopt.", (
+            ('mode', _NP, _auto.FeasoptMode, _cls.feasopt_mode_constants),
+            ('tolerance', _NP, _auto.FeasoptTolerance, None),
+        )), None),
+        ('lpmethod', _NP, _auto.setLPMethod, _cls.alg_constants),
+        ('mip', _PG, ("mip", "Parameters for mixed integer optimization.", (
+            ('cuts', _PG, ("cuts", "Types of cuts used during mixed integer optimization.", (
+                ('bqp', _NP, _auto.MIPCutsBQP, _cls.v_agg_constants),
+                ('cliques', _NP, _auto.MIPCutsCliques, _cls.v_agg_constants),
+                ('covers', _NP, _auto.MIPCutsCovers, _cls.v_agg_constants),
+                ('disjunctive', _NP, _auto.MIPCutsDisjunctive, _cls.v_agg_constants),
+                ('flowcovers', _NP, _auto.MIPCutsFlowCovers, _cls.agg_constants),
+                ('gomory', _NP, _auto.MIPCutsGomory, _cls.agg_constants),
+                ('gubcovers', _NP, _auto.MIPCutsGUBCovers, _cls.agg_constants),
+                ('implied', _NP, _auto.MIPCutsImplied, _cls.agg_constants),
+                ('liftproj', _NP, _auto.MIPCutsLiftProj, _cls.v_agg_constants),
+                ('localimplied', _NP, _auto.MIPCutsLocalImplied, _cls.v_agg_constants),
+                ('mcfcut', _NP, _auto.MIPCutsMCFCut, _cls.agg_constants),
+                ('mircut', _NP, _auto.MIPCutsMIRCut, _cls.agg_constants),
+                ('nodecuts', _NP, _auto.MIPCutsNodecuts, _cls.v_agg_constants),
+                ('pathcut', _NP, _auto.MIPCutsPathCut, _cls.agg_constants),
+                ('rlt', _NP, _auto.MIPCutsRLT, _cls.v_agg_constants),
+                ('zerohalfcut', _NP, _auto.MIPCutsZeroHalfCut, _cls.agg_constants),
+            )), None),
+            ('display', _NP, _auto.MIPDisplay, _cls.mip_display_constants),
+            ('interval', _NP, _auto.MIPInterval, None),
+            ('limits', _PG, ("limits", "Limits for mixed integer optimization.", (
+                ('aggforcut', _NP, _auto.MIPLimitsAggForCut, None),
+                ('auxrootthreads', _NP, _auto.MIPLimitsAuxRootThreads, None),
+                ('cutpasses', _NP, _auto.MIPLimitsCutPasses, None),
+                ('cutsfactor', _NP, _auto.MIPLimitsCutsFactor, None),
+                ('eachcutlimit', _NP, _auto.MIPLimitsEachCutLimit, None),
+                ('gomorycand', _NP, _auto.MIPLimitsGomoryCand, None),
+                ('gomorypass', _NP, _auto.MIPLimitsGomoryPass, None),
+                ('nodes', _NP, _auto.MIPLimitsNodes, None),
+                ('polishtime', _NP, _auto.MIPLimitsPolishTime, None),
+                ('populate', _NP, _auto.MIPLimitsPopulate, None),
+                ('probedettime', _NP, _auto.MIPLimitsProbeDetTime, None),
+                ('probetime', _NP, _auto.MIPLimitsProbeTime, None),
+                ('repairtries', _NP, _auto.MIPLimitsRepairTries, None),
+                ('solutions', _NP, _auto.MIPLimitsSolutions, None),
+                ('strongcand', _NP, _auto.MIPLimitsStrongCand, None),
+                ('strongit', _NP, _auto.MIPLimitsStrongIt, None),
+                ('treememory', _NP, _auto.MIPLimitsTreeMemory, None),
+            )), None),
+            ('ordertype', _NP, _auto.MIPOrderType, _cls.ordertype_constants),
+            ('polishafter', _PG, ("polishafter", "Starting conditions for solution polishing.", (
+                ('absmipgap', _NP, _auto.MIPPolishAfterAbsMIPGap, None),
+                ('dettime', _NP, _auto.MIPPolishAfterDetTime, None),
+                ('mipgap', _NP, _auto.MIPPolishAfterMIPGap, None),
+                ('nodes', _NP, _auto.MIPPolishAfterNodes, None),
+                ('solutions', _NP, _auto.MIPPolishAfterSolutions, None),
+                ('time', _NP, _auto.MIPPolishAfterTime, None),
+            )), None),
+            ('pool', _PG, ("pool", "Solution pool characteristics.", (
+                ('absgap', _NP, _auto.MIPPoolAbsGap, None),
+                ('capacity', _NP, _auto.MIPPoolCapacity, None),
+                ('intensity', _NP, _auto.MIPPoolIntensity, _cls.v_agg_constants),
+                ('relgap', _NP, _auto.MIPPoolRelGap, None),
+                ('replace', _NP, _auto.MIPPoolReplace, _cls.replace_constants),
+            )), None),
+            ('strategy', _PG, ("strategy", "Strategy for mixed integer optimization.", (
+                ('backtrack', _NP, _auto.MIPStrategyBacktrack, None),
+                ('bbinterval', _NP, _auto.MIPStrategyBBInterval, None),
+                ('branch', _NP, _auto.MIPStrategyBranch, _cls.brdir_constants),
+                ('dive', _NP, _auto.MIPStrategyDive, _cls.dive_constants),
+                ('file', _NP, _auto.MIPStrategyFile, _cls.file_constants),
+                ('fpheur', _NP, _auto.MIPStrategyFPHeur, _cls.fpheur_constants),
+                ('heuristiceffort', _NP, _auto.MIPStrategyHeuristicEffort, None),
+                ('heuristicfreq', _NP, _auto.MIPStrategyHeuristicFreq, None),
+                ('kappastats', _NP, _auto.MIPStrategyKappaStats, _cls.kappastats_constants),
+                ('lbheur', _NP, _auto.MIPStrategyLBHeur, _cls.off_on_constants),
+                ('miqcpstrat', _NP, _auto.MIPStrategyMIQCPStrat, _cls.miqcp_constants),
+                ('nodeselect', _NP, _auto.MIPStrategyNodeSelect, _cls.nodesel_constants),
+                ('order', _NP, _auto.MIPStrategyOrder, _cls.off_on_constants),
+                ('presolvenode', _NP, _auto.MIPStrategyPresolveNode, _cls.presolve_constants),
+                ('probe', _NP, _auto.MIPStrategyProbe, _cls.v_agg_constants),
+                ('rinsheur', _NP, _auto.MIPStrategyRINSHeur, None),
+                ('search', _NP, _auto.MIPStrategySearch, _cls.search_constants),
+                ('startalgorithm', _NP, _auto.MIPStrategyStartAlgorithm, _cls.alg_constants),
+                ('subalgorithm', _NP, _auto.MIPStrategySubAlgorithm, _cls.subalg_constants),
+                ('variableselect', _NP, _auto.MIPStrategyVariableSelect, _cls.varsel_constants),
+            )), None),
+            ('submip', _PG, ("submip", "Parameters used when solving sub-MIPs.", (
+                ('startalg', _NP, _auto.MIPSubMIPStartAlg, _cls.subalg_constants),
+                ('subalg', _NP, _auto.MIPSubMIPSubAlg, _cls.subalg_constants),
+                ('nodelimit', _NP, _auto.MIPSubMIPNodeLimit, None),
+                ('scale', _NP, _auto.MIPSubMIPScale, _cls.scale_constants),
+            )), None),
+            ('tolerances', _PG, ("tolerances", "Tolerances for mixed integer optimization.", (
+                ('absmipgap', _NP, _auto.MIPTolerancesAbsMIPGap, None),
+                ('linearization', _NP, _auto.MIPTolerancesLinearization, None),
+                ('integrality', _NP, _auto.MIPTolerancesIntegrality, None),
+                ('lowercutoff', _NP, _auto.MIPTolerancesLowerCutoff, None),
+                ('mipgap', _NP, _auto.MIPTolerancesMIPGap, None),
+                ('objdifference', _NP, _auto.MIPTolerancesObjDifference, None),
+                ('relobjdifference', _NP, _auto.MIPTolerancesRelObjDifference, None),
+                ('uppercutoff', _NP, _auto.MIPTolerancesUpperCutoff, None),
+            )), None),
+        )), None),
+        ('multiobjective', _PG, ("multiobjective", "Parameters for multi-objective optimization.", (
+            ('display', _NP, _auto.MultiObjectiveDisplay, _cls.display_constants),
+        )), None),
+        ('network', _PG, ("network", "Parameters for network optimizations.", (
+            ('display', _NP, _auto.NetworkDisplay, _cls.network_display_constants),
+            ('iterations', _NP, _auto.NetworkIterations, None),
+            ('netfind', _NP, _auto.NetworkNetFind, _cls.network_netfind_constants),
+            ('pricing', _NP, _auto.NetworkPricing, _cls.network_pricing_constants),
+            ('tolerances', _PG, ("tolerances", "Numerical tolerances for network simplex optimization.", (
+                ('feasibility', _NP, _auto.NetworkTolerancesFeasibility, None),
+                ('optimality', _NP, _auto.NetworkTolerancesOptimality, None),
+            )), None),
+        )), None),
+        ('optimalitytarget', _NP, _auto.setOptimalityTarget, _cls.optimalitytarget_constants),
+        ('output', _PG, ("output", "Extent and destinations of outputs.", (
+            ('clonelog', _NP, _auto.OutputCloneLog, _cls.off_on_constants),
+            ('intsolfileprefix', _SP, _auto.OutputIntSolFilePrefix, None),
+            ('mpslong', _NP, _auto.OutputMPSLong, _cls.off_on_constants),
+            ('writelevel', _NP, _auto.OutputWriteLevel, _cls.writelevel_constants),
+        )), None),
+        ('parallel', _NP, _auto.setParallel, _cls.par_constants),
+        ('paramdisplay', _NP, _auto.setParamDisplay, _cls.off_on_constants),
+        ('preprocessing', _PG, ("preprocessing", "Parameters for preprocessing.", (
+            ('aggregator', _NP, _auto.PreprocessingAggregator, None),
+            ('boundstrength', _NP, _auto.PreprocessingBoundStrength, _cls.auto_off_on_constants),
+            ('coeffreduce', _NP, _auto.PreprocessingCoeffReduce, _cls.coeffreduce_constants),
+            ('dependency', _NP, _auto.PreprocessingDependency, _cls.dependency_constants),
+            ('dual', _NP, _auto.PreprocessingDual, _cls.dual_constants),
+            ('fill', _NP, _auto.PreprocessingFill, None),
+            ('folding', _NP, _auto.PreprocessingFolding, None),
+            ('linear', _NP, _auto.PreprocessingLinear, _cls.linear_constants),
+            ('numpass', _NP, _auto.PreprocessingNumPass, None),
+            ('presolve', _NP, _auto.PreprocessingPresolve, _cls.off_on_constants),
+            ('qcpduals', _NP, _auto.PreprocessingQCPDuals, _cls.qcpduals_constants),
+            ('qpmakepsd', _NP, _auto.PreprocessingQPMakePSD, _cls.off_on_constants),
+            ('qtolin', _NP, _auto.PreprocessingQToLin, _cls.auto_off_on_constants),
+            ('reduce', _NP, _auto.PreprocessingReduce, _cls.prered_constants),
+            ('reformulations', _NP, _auto.PreprocessingReformulations, _cls.prereform_constants),
+            ('relax', _NP, _auto.PreprocessingRelax, _cls.auto_off_on_constants),
+            ('repeatpresolve', _NP, _auto.PreprocessingRepeatPresolve, _cls.repeatpre_constants),
+            ('sos1reform', _NP, _auto.PreprocessingSOS1Reform, _cls.sos1reform_constants),
+            ('sos2reform', _NP, _auto.PreprocessingSOS2Reform, _cls.sos2reform_constants),
+            ('symmetry', _NP, _auto.PreprocessingSymmetry, _cls.sym_constants),
+        )), None),
+        ('qpmethod', _NP, _auto.setQPMethod, _cls.qp_alg_constants),
+        ('randomseed', _NP, _auto.setRandomSeed, None),
+        ('read', _PG, ("read", "Problem read parameters.", (
+            ('constraints', _NP, _auto.ReadConstraints, None),
+            ('datacheck', _NP, _auto.ReadDataCheck, _cls.datacheck_constants),
+            ('fileencoding', _SP, _auto.ReadFileEncoding, None),
+            ('nonzeros', _NP, _auto.ReadNonzeros, None),
+            ('qpnonzeros', _NP, _auto.ReadQPNonzeros, None),
+            ('scale', _NP, _auto.ReadScale, _cls.scale_constants),
+            ('variables', _NP, _auto.ReadVariables, None),
+            ('warninglimit', _NP, _auto.ReadWarningLimit, None),
+        )), None),
+        ('record', _NP, _auto.setRecord, _cls.off_on_constants),
+        ('sifting', _PG, ("sifting", "Parameters for sifting optimization.", (
+            ('algorithm', _NP, _auto.SiftingAlgorithm, _cls.sift_alg_constants),
+            ('simplex', _NP, _auto.SiftingSimplex, _cls.off_on_constants),
+            ('display', _NP, _auto.SiftingDisplay, _cls.display_constants),
+            ('iterations', _NP, _auto.SiftingIterations, None),
+        )), None),
+        ('simplex', _PG, ("simplex", "Parameters for primal and dual simplex optimizations.", (
+            ('crash', _NP, _auto.SimplexCrash, None),
+            ('dgradient', _NP, _auto.SimplexDGradient, _cls.dual_pricing_constants),
+            ('display', _NP, _auto.SimplexDisplay, _cls.display_constants),
+            ('dynamicrows', _NP, _auto.SimplexDynamicRows, None),
+            ('limits', _PG, ("limits", "Limits for simplex optimization.", (
+                ('iterations', _NP, _auto.SimplexLimitsIterations, None),
+                ('lowerobj', _NP, _auto.SimplexLimitsLowerObj, None),
+                ('perturbation', _NP, _auto.SimplexLimitsPerturbation, None),
+                ('singularity', _NP, _auto.SimplexLimitsSingularity, None),
+                ('upperobj', _NP, _auto.SimplexLimitsUpperObj, None),
+            )), None),
+            ('perturbation', _PG, ("perturbation", "Perturbation controls.", (
+                ('constant', _NP, _auto.SimplexPerturbationConstant, None),
+                ('indicator', _NP, _auto.SimplexPerturbationIndicator, _cls.off_on_constants),
+            )), None),
+            ('pgradient', _NP, _auto.SimplexPGradient, _cls.primal_pricing_constants),
+            ('pricing', _NP, _auto.SimplexPricing, None),
+            ('refactor', _NP, _auto.SimplexRefactor, None),
+            ('tolerances', _PG, ("tolerances", "Numerical tolerances for simplex optimization.", (
+                ('feasibility', _NP, _auto.SimplexTolerancesFeasibility, None),
+                ('markowitz', _NP, _auto.SimplexTolerancesMarkowitz, None),
+                ('optimality', _NP, _auto.SimplexTolerancesOptimality, None),
+            )), None),
+        )), None),
+        ('solutiontype', _NP, _auto.setSolutionType, _cls.solutiontype_constants),
+        ('threads', _NP, _auto.setThreads, None),
+        ('timelimit', _NP, _auto.setTimeLimit, None),
+        ('tune', _PG, ("tune", "Parameters for parameter tuning.", (
+            ('dettimelimit', _NP, _auto.TuneDetTimeLimit, None),
+            ('display', _NP, _auto.TuneDisplay, _cls.tune_display_constants),
+            ('measure', _NP, _auto.TuneMeasure, _cls.measure_constants),
+            ('repeat', _NP, _auto.TuneRepeat, None),
+            ('timelimit', _NP, _auto.TuneTimeLimit, None),
+        )), None),
+        ('workdir', _SP, _auto.setWorkDir, None),
+        ('workmem', _NP, _auto.setWorkMem, None),
+    ))
+
+
+def _compile_spec(spec):
+    """non-public: recursively turns the nested _SPEC literal into
+    _MembersSpec objects (group rows carry their sub-spec in the about
+    slot)."""
+    name, help_, rows = spec
+    return _MembersSpec(name, help_, tuple(
+        (pyname, cls, _compile_spec(about) if cls is _PG else about,
+         constants)
+        for pyname, cls, about, constants in rows))
+
+
+root_members = _compile_spec(_SPEC)